@@ -1,18 +1,44 @@
 import subprocess
 import os
+import functools
+import hashlib
 import sys
 import logging
+import logging.handlers
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
+import queue
+import re
+import select
+import shlex
+import shutil
+import socket
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 로그는 큐에 넣기만 하고, 출력은 리스너 스레드 하나가 전담
+# (여러 기기 스레드가 stdout 락을 두고 경합하지 않도록)
+_log_queue = queue.Queue()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+log = logging.getLogger(__name__)
+
+
+def flush_logs():
+    """큐에 쌓인 로그가 모두 출력될 때까지 기다립니다 (print/input 전에 호출해 출력 순서를 맞춤)."""
+    # 리스너가 돌고 있지 않으면 task_done()이 오지 않아 join()이 영원히 대기하므로 건너뜀
+    if log_listener._thread is not None:
+        _log_queue.join()
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """exe로 빌드된 경우에도 리소스 파일을 찾을 수 있도록 경로 반환"""
     if hasattr(sys, '_MEIPASS'):
@@ -20,66 +46,413 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath('.'), relative_path)
 
 
-def run_command(cmd, check=False, timeout=60, retries=1):
-    """주어진 명령어를 실행하고 결과를 반환합니다. 실패 시 재시도합니다."""
+# adb 실행 파일 경로 (호출마다 PATH 탐색하지 않도록 시작 시 한 번만 찾음)
+ADB = shutil.which('adb') or 'adb'
+
+
+def ignore_secure_folder_error(result):
+    """보안 폴더(user 150) 접근 에러는 무시합니다 — shell 권한으로 접근 불가"""
+    if result.stderr and 'SecurityException' in result.stderr and 'user 150' in result.stderr:
+        log.debug('[보안폴더] 무시: %s', result.stderr.strip().split('\n')[0])
+        return subprocess.CompletedProcess(result.args, returncode=0, stdout=result.stdout, stderr='')
+    return result
+
+
+def run_command(cmd, check=False, timeout=60, retries=1, capture=True):
+    """주어진 명령어를 실행하고 결과를 반환합니다. 실패 시 재시도합니다.
+
+    capture=False이면 출력을 DEVNULL로 버립니다 (출력을 쓰지 않는 호출용, returncode만 유효).
+    """
     for attempt in range(1 + retries):
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout, encoding='utf-8', errors='replace')
-            # 보안 폴더(user 150) 접근 에러는 무시 — shell 권한으로 접근 불가
-            if result.stderr and 'SecurityException' in result.stderr and 'user 150' in result.stderr:
-                logging.debug('[보안폴더] 무시: %s', result.stderr.strip().split('\n')[0])
-                result = subprocess.CompletedProcess(cmd, returncode=0, stdout=result.stdout, stderr='')
+            if capture:
+                result = subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=timeout, encoding='utf-8', errors='replace')
+                result = ignore_secure_folder_error(result)
+            else:
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=check, timeout=timeout)
             if result.returncode == 0 or not check:
                 return result
         except subprocess.TimeoutExpired:
-            logging.warning('명령어 타임아웃(%ds): %s (시도 %d/%d)', timeout, ' '.join(cmd), attempt + 1, 1 + retries)
+            log.warning('명령어 타임아웃(%ds): %s (시도 %d/%d)', timeout, ' '.join(cmd), attempt + 1, 1 + retries)
         except subprocess.CalledProcessError as e:
-            logging.error('명령어 실행 실패: %s / %s (시도 %d/%d)', ' '.join(cmd), e.stderr, attempt + 1, 1 + retries)
+            log.error('명령어 실행 실패: %s / %s (시도 %d/%d)', ' '.join(cmd), e.stderr, attempt + 1, 1 + retries)
             if attempt == retries:
                 return e
         if attempt < retries:
-            logging.info('RETRY: %s', ' '.join(cmd))
+            log.info('RETRY: %s', ' '.join(cmd))
             time.sleep(2)
     # 타임아웃 등으로 result가 없는 경우 빈 결과 반환
     return subprocess.CompletedProcess(cmd, returncode=-1, stdout='', stderr='TIMEOUT')
 
 
-def get_connected_devices():
-    """연결된 ADB 디바이스 목록을 가져옵니다."""
-    output = subprocess.check_output(['adb', 'devices']).decode('utf-8')
+# adb 서버 (adb 클라이언트 프로세스 없이 직접 연결)
+ADB_SERVER_ADDR = ('127.0.0.1', 5037)
+
+
+def _recv_exact(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('adb 서버 연결 종료')
+        data += chunk
+    return data
+
+
+def _read_frame(sock):
+    """adb 서버의 길이(16진수 4자리) 접두 응답 하나를 읽습니다."""
+    length = int(_recv_exact(sock, 4), 16)
+    return _recv_exact(sock, length).decode('utf-8', errors='replace')
+
+
+def _send_request(sock, service):
+    """길이 접두 요청을 보내고 OKAY 응답을 확인합니다."""
+    sock.sendall(f'{len(service):04x}{service}'.encode('utf-8'))
+    status = _recv_exact(sock, 4)
+    if status != b'OKAY':
+        raise ConnectionError(f'{service} 실패: {_read_frame(sock)}')
+
+
+def adb_host_request(service, timeout=5):
+    """adb 서버에 host 서비스 요청을 보내고 OKAY 응답을 확인한 소켓을 반환합니다."""
+    sock = socket.create_connection(ADB_SERVER_ADDR, timeout=timeout)
+    try:
+        _send_request(sock, service)
+    except (OSError, ValueError):
+        sock.close()
+        raise
+    return sock
+
+
+# shell v2 프로토콜 패킷 종류
+SHELL_V2_STDOUT = 1
+SHELL_V2_STDERR = 2
+SHELL_V2_EXIT = 3
+SHELL_V2_CLOSE_STDIN = 4
+
+
+class AdbSocket:
+    """adb 클라이언트 프로세스 없이 adb 서버와 직접 통신해 shell 명령어를 실행합니다.
+
+    adb 서버는 서비스 하나당 연결 하나를 쓰므로 명령어마다 로컬 TCP 연결만 새로 열고,
+    adb 프로세스 생성(fork/exec)은 생략합니다.
+    """
+
+    # serial → adb 서버 transport id. 시리얼 조회는 처음 한 번만 하고 이후엔 id로 바로 선택
+    _transport_ids = {}
+
+    def __init__(self, serial):
+        self.serial = serial
+
+    def connect(self, timeout):
+        """transport를 선택한 소켓을 반환합니다."""
+        transport_id = self._transport_ids.get(self.serial)
+        if transport_id is not None:
+            try:
+                return adb_host_request(f'host:transport-id:{transport_id}', timeout)
+            except ConnectionError:
+                # 기기 재연결로 id가 바뀐 경우 → 시리얼로 다시 조회
+                self._transport_ids.pop(self.serial, None)
+
+        try:
+            sock = adb_host_request(f'host:tport:serial:{self.serial}', timeout)
+        except ConnectionError:
+            # tport 미지원 구버전 adb 서버
+            return adb_host_request(f'host:transport:{self.serial}', timeout)
+        try:
+            self._transport_ids[self.serial] = struct.unpack('<Q', _recv_exact(sock, 8))[0]
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def shell(self, cmd, timeout=60):
+        """shell v2 프로토콜로 명령어를 실행하고 CompletedProcess를 반환합니다.
+
+        명령어를 보내기 전(연결/transport 선택/요청 거부)에 실패하면 OSError를 그대로 올리고,
+        보낸 뒤 끊기거나 타임아웃되면 명령어가 이미 실행됐을 수 있으므로 returncode=-1 결과를 반환합니다.
+        """
+        with self.connect(timeout) as sock:
+            _send_request(sock, f'shell,v2,raw:{cmd}')
+            stdout, stderr, returncode = bytearray(), bytearray(), -1
+            try:
+                # 명령어가 stdin을 기다리지 않도록 바로 닫음
+                sock.sendall(struct.pack('<BI', SHELL_V2_CLOSE_STDIN, 0))
+                while True:
+                    packet_id, length = struct.unpack('<BI', _recv_exact(sock, 5))
+                    payload = _recv_exact(sock, length)
+                    if packet_id == SHELL_V2_STDOUT:
+                        stdout += payload
+                    elif packet_id == SHELL_V2_STDERR:
+                        stderr += payload
+                    elif packet_id == SHELL_V2_EXIT:
+                        returncode = payload[0]
+                        break
+            except socket.timeout:
+                log.warning('[%s] 명령어 타임아웃(%ds): %s', self.serial, timeout, cmd)
+                return subprocess.CompletedProcess(cmd, returncode=-1, stdout='', stderr='TIMEOUT')
+            except OSError as e:
+                log.warning('[%s] 명령어 실행 중 adb 서버 연결 끊김: %s (%s)', self.serial, cmd, e)
+                return subprocess.CompletedProcess(cmd, returncode=-1, stdout='', stderr=str(e))
+        result = subprocess.CompletedProcess(
+            cmd, returncode=returncode,
+            stdout=stdout.decode('utf-8', errors='replace'),
+            stderr=stderr.decode('utf-8', errors='replace'))
+        return ignore_secure_folder_error(result)
+
+
+# 명령어 종료 표식 — stdout에는 종료코드를, stderr에는 끝 표시만 남깁니다.
+SHELL_SENTINEL = '__END__'
+_RC_RE = re.compile(r'__RC__(\d+)' + SHELL_SENTINEL + r'$')
+
+
+class AdbShell:
+    """기기당 하나의 `adb shell` 세션을 유지하며 명령어를 순차 실행합니다.
+
+    매 명령어마다 adb 프로세스 생성 + adbd 연결을 반복하지 않도록
+    세션의 stdin으로 명령어를 보내고, 종료 표식이 나올 때까지 출력을 읽습니다.
+    """
+
+    def __init__(self, serial):
+        self.serial = serial
+        self.lock = threading.Lock()
+        # Windows에서 줄바꿈이 \r\n으로 바뀌지 않도록 바이너리 파이프 사용
+        self.proc = subprocess.Popen(
+            [ADB, '-s', serial, 'shell'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+        self._stdout = queue.Queue()
+        self._stderr = queue.Queue()
+        for stream, lines in ((self.proc.stdout, self._stdout), (self.proc.stderr, self._stderr)):
+            threading.Thread(target=self._pump, args=(stream, lines), daemon=True).start()
+
+    @staticmethod
+    def _pump(stream, lines):
+        for line in iter(stream.readline, b''):
+            lines.put(line.decode('utf-8', errors='replace'))
+        lines.put(None)
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def _read_until(self, lines, deadline, is_end):
+        """종료 표식 줄까지 읽어 (출력, 표식 줄)을 반환합니다. 타임아웃/세션 종료 시 표식 줄은 None."""
+        out = []
+        while True:
+            try:
+                line = lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                return ''.join(out), None
+            if line is None:
+                return ''.join(out), None
+            if is_end(line):
+                return ''.join(out), line
+            out.append(line)
+
+    def run(self, cmd, timeout=60):
+        """세션에서 명령어를 실행하고 CompletedProcess를 반환합니다. 실패 시 세션을 닫고 None을 반환합니다."""
+        if not self.alive():
+            return None
+        # 명령어가 세션 stdin을 읽어 다음 명령어를 삼키지 않도록 /dev/null 연결
+        script = f'{{ {cmd}\n}} </dev/null; echo "__RC__$?{SHELL_SENTINEL}"; echo {SHELL_SENTINEL} >&2\n'
+        try:
+            self.proc.stdin.write(script.encode('utf-8'))
+        except OSError:
+            self.close()
+            return None
+
+        deadline = time.monotonic() + timeout
+        stdout, end = self._read_until(self._stdout, deadline, lambda l: _RC_RE.search(l.rstrip()))
+        if end is None:
+            log.warning('[%s] shell 세션 응답 없음(%ds): %s', self.serial, timeout, cmd)
+            self.close()
+            return None
+        # 마지막 줄바꿈 없이 끝난 출력은 표식 앞에 붙어 나옴
+        match = _RC_RE.search(end.rstrip())
+        stdout += end.rstrip()[:match.start()]
+        stderr, err_end = self._read_until(self._stderr, deadline, lambda l: l.rstrip().endswith(SHELL_SENTINEL))
+        if err_end is None:
+            self.close()
+            return None
+        stderr += err_end.rstrip()[:-len(SHELL_SENTINEL)]
+
+        result = subprocess.CompletedProcess(cmd, returncode=int(match.group(1)), stdout=stdout, stderr=stderr)
+        return ignore_secure_folder_error(result)
+
+    def close(self):
+        if self.alive():
+            try:
+                self.proc.stdin.write(b'exit\n')
+                self.proc.stdin.close()
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+
+
+# 기기별 persistent shell 세션 (process_device 동안 유지)
+_shells = {}
+
+
+def open_shell(serial):
+    """기기의 persistent shell 세션을 엽니다. 실패하면 단발 adb shell로 동작합니다."""
+    try:
+        _shells[serial] = AdbShell(serial)
+    except OSError as e:
+        log.warning('[%s] shell 세션 생성 실패 — 단발 실행으로 진행: %s', serial, e)
+
+
+def close_shell(serial):
+    shell = _shells.pop(serial, None)
+    if shell:
+        shell.close()
+
+
+def run_shell(serial, cmd, timeout=60, capture=True):
+    """기기에서 shell 명령어를 실행합니다.
+
+    persistent 세션이 있으면 재사용하고, 없거나 사용 중/끊김이면 adb 서버 소켓으로,
+    그것도 안 되면 adb CLI로 단발 실행합니다. capture는 CLI 실행에만 적용됩니다 (run_command 참고).
+    """
+    shell = _shells.get(serial)
+    retries = 1
+    # 세션을 다른 스레드가 사용 중이면 기다리지 않고 단발 실행 (기기 내 병렬 호출)
+    if shell and shell.lock.acquire(blocking=False):
+        try:
+            result = shell.run(cmd, timeout)
+        finally:
+            shell.lock.release()
+        if result is not None:
+            return result
+        # 세션 실행이 첫 시도였으므로 단발 실행은 한 번만
+        _shells.pop(serial, None)
+        retries = 0
+    # 명령어 전송 전에 실패한 경우에만 CLI로 넘어감 (전송 후 끊김은 AdbSocket.shell이 결과로 반환)
+    try:
+        return AdbSocket(serial).shell(cmd, timeout)
+    except (OSError, ValueError) as e:
+        log.debug('[%s] adb 서버 직접 연결 실패 — adb CLI로 실행: %s', serial, e)
+    return run_command([ADB, '-s', serial, 'shell', cmd], timeout=timeout, retries=retries, capture=capture)
+
+
+def parse_device_list(output):
+    """`adb devices` 형식의 출력에서 사용 가능한(device 상태) 시리얼만 추립니다."""
     devices = []
-    for line in output.strip().splitlines()[1:]:
-        parts = line.strip().split('\t')
-        if len(parts) == 2 and parts[1] == 'device':
-            devices.append(parts[0])
+    for line in output.splitlines():
+        serial, _, state = line.strip().partition('\t')
+        if state == 'device':
+            devices.append(serial)
     return devices
 
 
+def get_connected_devices():
+    """연결된 ADB 디바이스 목록을 가져옵니다."""
+    try:
+        with adb_host_request('host:devices') as sock:
+            return parse_device_list(_read_frame(sock))
+    except (OSError, ValueError):
+        # adb 서버가 아직 안 떠 있으면 CLI가 서버를 띄워줌
+        result = subprocess.run([ADB, 'devices'], capture_output=True, text=True, check=True)
+        return parse_device_list(result.stdout)
+
+
+def track_devices():
+    """연결된 기기 목록을 상태가 바뀔 때마다 yield 합니다.
+
+    adb 서버의 host:track-devices를 구독해 폴링 없이 대기합니다.
+    서버 연결에 실패하거나 끊기면 get_connected_devices로 2초마다 폴링하며 재연결을 시도합니다.
+    """
+    while True:
+        try:
+            sock = adb_host_request('host:track-devices')
+        except (OSError, ValueError) as e:
+            log.debug('기기 연결 감시 실패 — 폴링으로 대체: %s', e)
+            yield get_connected_devices()
+            time.sleep(2)
+            continue
+        with sock:
+            while True:
+                # Windows에서도 Ctrl+C가 먹히도록 짧은 주기로 대기
+                readable, _, _ = select.select([sock], [], [], 1)
+                if not readable:
+                    continue
+                try:
+                    devices = parse_device_list(_read_frame(sock))
+                except (OSError, ValueError) as e:
+                    log.warning('기기 연결 감시 중단 — 재연결: %s', e)
+                    break
+                yield devices
+
+
 MODEL_TO_SERIES = {
     'S91': 'S23', 'S92': 'S24', 'S93': 'S25', 'S94': 'S26',
 }
 
+# 번들 리소스 경로와 존재 여부는 실행 중 바뀌지 않으므로 시작 시 한 번만 계산
+APK_PATHS = {
+    'nmap': resource_path('nmap.apk'),
+    'filemanager': resource_path('filemanager.apk'),
+}
+WALLPAPER_PATHS = {series: resource_path(f'{series}.png') for series in MODEL_TO_SERIES.values()}
+AVAILABLE_RESOURCES = frozenset(
+    path for path in (*APK_PATHS.values(), *WALLPAPER_PATHS.values()) if os.path.exists(path))
+
+
+def resource_available(path):
+    """리소스 파일이 있는지 확인합니다 (미리 확인한 경로는 stat 생략)."""
+    return path in AVAILABLE_RESOURCES or os.path.exists(path)
+
 
 def detect_series(serial):
     """모델명(getprop)으로 디바이스 시리즈를 자동 감지합니다."""
-    result = run_command(['adb', '-s', serial, 'shell', 'getprop', 'ro.product.model'])
+    result = run_shell(serial, 'getprop ro.product.model')
     model = result.stdout.strip() if hasattr(result, 'stdout') and result.stdout else ''
     if model:
         # SM-S948N → S94 → S26
         for prefix, series in MODEL_TO_SERIES.items():
             if prefix in model:
-                logging.info('[%s] 모델: %s → 시리즈: %s', serial, model, series)
+                log.info('[%s] 모델: %s → 시리즈: %s', serial, model, series)
                 return series
-        logging.warning('[%s] 모델 %s — 매칭 없음, 기본값 S24 사용', serial, model)
+        log.warning('[%s] 모델 %s — 매칭 없음, 기본값 S24 사용', serial, model)
     else:
-        logging.warning('[%s] 모델명 조회 실패 — 기본값 S24 사용', serial)
+        log.warning('[%s] 모델명 조회 실패 — 기본값 S24 사용', serial)
     return 'S24'
 
 
+# 기기 하나에서 동시에 실행할 독립 adb 호출 수
+DEVICE_WORKERS = 4
+
+
 def clear_app_data(serial, package, desc):
-    """특정 앱의 데이터를 초기화합니다."""
-    logging.info('[%s] %s 데이터 초기화 중...', serial, desc)
-    run_command(['adb', '-s', serial, 'shell', 'pm', 'clear', package])
+    """특정 앱의 데이터를 초기화합니다. (INFO 로그는 호출 측에서 묶어서 남김)"""
+    log.debug('[%s] %s 데이터 초기화 중...', serial, desc)
+    run_shell(serial, f'pm clear {package}', capture=False)
+
+
+def log_cleared_apps(serial, apps):
+    """초기화한 앱 목록을 요약 로그 한 줄로 남깁니다. apps: {패키지: 설명}"""
+    log.info('[%s] 앱 데이터 초기화 %d개: %s', serial, len(apps), ', '.join(apps.values()))
+
+
+def clear_apps_data(serial, apps):
+    """여러 앱의 데이터를 초기화하고 요약 로그를 한 줄로 남깁니다. apps: {패키지: 설명}
+
+    앱끼리는 순서 의존이 없으므로 DEVICE_WORKERS개씩 동시에 초기화합니다.
+    """
+    with ThreadPoolExecutor(max_workers=DEVICE_WORKERS) as executor:
+        list(executor.map(lambda item: clear_app_data(serial, *item), apps.items()))
+    log_cleared_apps(serial, apps)
+
+
+def wait_stopped(serial, packages, timeout=2.0):
+    """패키지 프로세스가 모두 종료될 때까지 pidof로 확인하며 기다립니다 (최대 timeout초)."""
+    cmd = 'pidof ' + ' '.join(packages)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = run_shell(serial, cmd)
+        # pidof: 프로세스 없으면 종료코드 1 + 빈 출력
+        if result.returncode in (0, 1) and not result.stdout.strip():
+            return True
+        time.sleep(0.1)
+    return False
 
 
 # ============================================================
@@ -97,6 +470,7 @@ LANGUAGE_OPTIONS = {
 
 def select_language():
     """사용자에게 언어 선택 메뉴를 표시합니다."""
+    flush_logs()
     print('\n========================================')
     print('  언어 설정을 선택해주세요')
     print('========================================')
@@ -116,19 +490,36 @@ def select_language():
         print('  잘못된 입력입니다. 다시 선택해주세요.')
 
 
+@functools.lru_cache(maxsize=None)
+def file_sha256(path):
+    """로컬 파일의 SHA-256 (번들 리소스는 실행 중 바뀌지 않으므로 캐시)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def push_dex_if_needed(serial, dex_name):
-    """DEX 헬퍼 파일을 기기에 푸시합니다. push 후 리모트 존재 여부를 검증합니다."""
+    """DEX 헬퍼 파일을 기기에 푸시합니다. push 후 리모트 존재 여부를 검증합니다.
+
+    기기에 같은 내용(SHA-256)의 파일이 이미 있으면 push를 생략합니다.
+    """
     local_path = resource_path(dex_name)
     remote_path = f'/data/local/tmp/{dex_name}'
     if not os.path.exists(local_path):
-        logging.warning('[%s] DEX 파일 없음: %s', serial, local_path)
+        log.warning('[%s] DEX 파일 없음: %s', serial, local_path)
         return False
-    run_command(['adb', '-s', serial, 'push', local_path, remote_path])
+    remote = run_shell(serial, f'sha256sum {remote_path}')
+    if remote.returncode == 0 and remote.stdout.split()[:1] == [file_sha256(local_path)]:
+        log.debug('[%s] DEX 동일 — push 생략: %s', serial, dex_name)
+        return True
+    run_command([ADB, '-s', serial, 'push', local_path, remote_path], capture=False)
     # 리모트 파일 존재 확인
-    check = run_command(['adb', '-s', serial, 'shell', 'ls', remote_path])
+    check = run_shell(serial, f'ls {remote_path}', capture=False)
     if hasattr(check, 'returncode') and check.returncode != 0:
-        logging.warning('[%s] DEX push 검증 실패, 재시도: %s', serial, dex_name)
-        run_command(['adb', '-s', serial, 'push', local_path, remote_path])
+        log.warning('[%s] DEX push 검증 실패, 재시도: %s', serial, dex_name)
+        run_command([ADB, '-s', serial, 'push', local_path, remote_path], capture=False)
     return True
 
 
@@ -145,98 +536,79 @@ def set_device_language(serial, locale):
         return
     # 선택된 언어를 맨 앞에, 나머지 기본 언어를 뒤에 배치
     locale_list = [locale] + [l for l in BASE_LOCALES if l != locale]
-    logging.info('[%s] 언어 설정 변경: %s', serial, ', '.join(locale_list))
+    log.info('[%s] 언어 설정 변경: %s', serial, ', '.join(locale_list))
 
     # DEX 파일 푸시
     if not push_dex_if_needed(serial, 'locale_changer.dex'):
-        logging.error('[%s] locale_changer.dex 없음 — 언어 변경 불가', serial)
+        log.error('[%s] locale_changer.dex 없음 — 언어 변경 불가', serial)
         return
 
     # app_process로 LocaleChanger 실행 (여러 로케일을 인자로 전달)
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/locale_changer.dex',
-        'app_process', '/system/bin', 'LocaleChanger'
-    ] + locale_list)
+    result = run_shell(serial, 'CLASSPATH=/data/local/tmp/locale_changer.dex '
+                               'app_process /system/bin LocaleChanger ' + ' '.join(locale_list))
 
     if hasattr(result, 'stdout') and 'SUCCESS' in result.stdout:
-        logging.info('[%s] 언어 설정 완료: %s', serial, ', '.join(locale_list))
+        log.info('[%s] 언어 설정 완료: %s', serial, ', '.join(locale_list))
     else:
         stderr = result.stderr if hasattr(result, 'stderr') else ''
         stdout = result.stdout if hasattr(result, 'stdout') else ''
-        logging.warning('[%s] 언어 설정 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
+        log.warning('[%s] 언어 설정 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
 
 
 # ============================================================
 # 2. 계정 관리: 삼성 계정 제외 모든 계정 삭제
 # ============================================================
 
-# 삼성 계정 타입 (보존)
-SAMSUNG_ACCOUNT_TYPES = [
+# 삼성 계정 타입 prefix (보존) — str.startswith에 그대로 넘기도록 tuple
+# (삼성 모바일 서비스 com.samsung.android.mobileservice는 com.samsung에 포함)
+SAMSUNG_ACCOUNT_TYPES = (
     'com.osp.app.signin',           # 삼성 계정 기본
-    'com.samsung.android.mobileservice',  # 삼성 모바일 서비스
     'com.samsung',                   # 삼성 공통 prefix
-]
+)
+
+
+# "Account {name=xxx, type=yyy}" 형태를 파싱
+_ACCOUNT_RE = re.compile(r'^\s*Account\s*\{\s*name=([^,}]+?)\s*,\s*type=([^}]+?)\s*\}', re.MULTILINE)
 
 
 def get_device_accounts(serial):
     """기기에 등록된 계정 목록을 조회합니다."""
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'dumpsys', 'account'
-    ])
+    # 기기에서 계정 줄만 걸러 받아 전체 덤프를 전송/버퍼링하지 않음
+    result = run_shell(serial, "dumpsys account | grep 'Account {'")
     if not hasattr(result, 'stdout') or not result.stdout:
         return []
 
-    accounts = []
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        # "Account {name=xxx, type=yyy}" 형태를 파싱
-        if line.startswith('Account {') and 'type=' in line:
-            try:
-                type_part = line.split('type=')[1].rstrip('}').strip()
-                name_part = line.split('name=')[1].split(',')[0].strip()
-                accounts.append({'name': name_part, 'type': type_part})
-            except (IndexError, ValueError):
-                continue
-    return accounts
+    return [{'name': m.group(1), 'type': m.group(2)} for m in _ACCOUNT_RE.finditer(result.stdout)]
 
 
 def is_samsung_account(account_type):
     """삼성 계정인지 확인합니다."""
-    for samsung_type in SAMSUNG_ACCOUNT_TYPES:
-        if account_type.startswith(samsung_type):
-            return True
-    return False
+    return account_type.startswith(SAMSUNG_ACCOUNT_TYPES)
 
 
 def remove_non_samsung_accounts(serial):
     """삼성 계정을 제외한 모든 계정을 삭제합니다 (app_process + DEX 방식)."""
-    logging.info('[%s] 삼성 계정 제외 전체 계정 삭제 시작...', serial)
+    log.info('[%s] 삼성 계정 제외 전체 계정 삭제 시작...', serial)
 
     # 삭제 전 계정 현황 로깅
     accounts = get_device_accounts(serial)
     if not accounts:
-        logging.info('[%s] 계정 조회 결과 없음 — DEX로 직접 삭제 시도', serial)
+        log.info('[%s] 계정 조회 결과 없음 — DEX로 직접 삭제 시도', serial)
     else:
         for account in accounts:
             if is_samsung_account(account['type']):
-                logging.info('[%s] 삼성 계정 보존 대상: %s (%s)', serial, account['name'], account['type'])
+                log.info('[%s] 삼성 계정 보존 대상: %s (%s)', serial, account['name'], account['type'])
             else:
-                logging.info('[%s] 계정 삭제 대상: %s (%s)', serial, account['name'], account['type'])
+                log.info('[%s] 계정 삭제 대상: %s (%s)', serial, account['name'], account['type'])
 
     # DEX 파일 푸시
     if not push_dex_if_needed(serial, 'account_remover.dex'):
-        logging.error('[%s] account_remover.dex 없음 — 계정 삭제 불가', serial)
+        log.error('[%s] account_remover.dex 없음 — 계정 삭제 불가', serial)
         return
 
     # app_process로 AccountRemover 실행
     # (IAccountManager.removeAccountAsUser를 직접 호출하여 계정 삭제)
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/account_remover.dex',
-        'app_process', '/system/bin', 'AccountRemover'
-    ])
+    result = run_shell(serial, 'CLASSPATH=/data/local/tmp/account_remover.dex app_process /system/bin AccountRemover')
 
     stdout = result.stdout if hasattr(result, 'stdout') else ''
 
@@ -246,29 +618,29 @@ def remove_non_samsung_accounts(serial):
         if line.startswith('REMOVING:'):
             parts = line.split(':', 2)
             if len(parts) >= 3:
-                logging.info('[%s] 계정 삭제 시도: %s (%s)', serial, parts[1], parts[2])
+                log.info('[%s] 계정 삭제 시도: %s (%s)', serial, parts[1], parts[2])
         elif line.startswith('OK:'):
-            logging.info('[%s] 계정 삭제 요청 완료: %s', serial, line[3:])
+            log.info('[%s] 계정 삭제 요청 완료: %s', serial, line[3:])
         elif line.startswith('FAIL:'):
-            logging.warning('[%s] 계정 삭제 실패: %s', serial, line[5:])
+            log.warning('[%s] 계정 삭제 실패: %s', serial, line[5:])
         elif line.startswith('REMAINING:'):
-            logging.info('[%s] 남은 계정 수: %s', serial, line[10:])
+            log.info('[%s] 남은 계정 수: %s', serial, line[10:])
         elif line.startswith('ACCOUNT:'):
             parts = line.split(':', 2)
             if len(parts) >= 3:
-                logging.info('[%s]   - %s (%s)', serial, parts[1], parts[2])
+                log.info('[%s]   - %s (%s)', serial, parts[1], parts[2])
 
     # 삭제 후 확인
     remaining = get_device_accounts(serial)
     non_samsung_remaining = [a for a in remaining if not is_samsung_account(a['type'])]
     if non_samsung_remaining:
-        logging.warning('[%s] 아직 남아있는 비삼성 계정 %d개:', serial, len(non_samsung_remaining))
+        log.warning('[%s] 아직 남아있는 비삼성 계정 %d개:', serial, len(non_samsung_remaining))
         for a in non_samsung_remaining:
-            logging.warning('[%s]   - %s (%s)', serial, a['name'], a['type'])
+            log.warning('[%s]   - %s (%s)', serial, a['name'], a['type'])
     else:
-        logging.info('[%s] 비삼성 계정 모두 제거 완료', serial)
+        log.info('[%s] 비삼성 계정 모두 제거 완료', serial)
 
-    logging.info('[%s] 삼성 계정 제외 전체 계정 삭제 완료', serial)
+    log.info('[%s] 삼성 계정 제외 전체 계정 삭제 완료', serial)
 
 
 # ============================================================
@@ -277,7 +649,7 @@ def remove_non_samsung_accounts(serial):
 
 def deep_clean_gallery_trash(serial):
     """삼성 갤러리 휴지통을 완전히 정리합니다."""
-    logging.info('[%s] 갤러리 휴지통 완전 정리 시작...', serial)
+    log.info('[%s] 갤러리 휴지통 완전 정리 시작...', serial)
 
     trash_paths = [
         # 삼성 갤러리 휴지통
@@ -317,102 +689,121 @@ def deep_clean_gallery_trash(serial):
         'com.google.android.providers.media.module',
     ]
 
-    # Step 1: 갤러리/파일 앱 강제 종료
-    force_cmd = 'am force-stop com.sec.android.gallery3d; am force-stop com.sec.android.app.myfiles'
-    run_command(['adb', '-s', serial, 'shell', force_cmd])
-
-    # Step 2: 휴지통/캐시 물리 파일 삭제
-    rm_cmd = 'rm -rf ' + ' '.join(trash_paths)
-    result = run_command(['adb', '-s', serial, 'shell', rm_cmd])
-    if hasattr(result, 'returncode') and result.returncode != 0:
-        logging.warning('[%s] rm -rf 일부 실패 (계속 진행)', serial)
+    # Step 1 + 2: 갤러리/파일 앱 강제 종료 → 휴지통/캐시 물리 파일 삭제 (한 번의 shell 호출)
+    # 실제로 있는 경로만 삭제하고 결과(DELETED/FAIL)를 출력
+    script = '\n'.join([
+        'am force-stop com.sec.android.gallery3d',
+        'am force-stop com.sec.android.app.myfiles',
+        'for p in ' + ' '.join(shlex.quote(p) for p in trash_paths) + '; do',
+        '  [ -e "$p" ] || continue',
+        '  if rm -rf "$p"; then echo "DELETED:$p"; else echo "FAIL:$p"; fi',
+        'done',
+    ])
+    result = run_shell(serial, script)
+    stdout = result.stdout if hasattr(result, 'stdout') else ''
+    deleted = [line[8:] for line in stdout.splitlines() if line.startswith('DELETED:')]
+    failed = [line[5:] for line in stdout.splitlines() if line.startswith('FAIL:')]
+    log.info('[%s] 휴지통/캐시 삭제 %d개: %s', serial, len(deleted), ', '.join(deleted) or '없음')
+    if failed:
+        log.warning('[%s] rm -rf 일부 실패 (계속 진행): %s', serial, ', '.join(failed))
 
     # Step 3: 미디어/갤러리 프로바이더 데이터 초기화
     pm_cmd = '; '.join(f'pm clear {pkg}' for pkg in clear_packages)
-    result = run_command(['adb', '-s', serial, 'shell', pm_cmd], timeout=90)
+    result = run_shell(serial, pm_cmd, timeout=90)
     stdout = result.stdout if hasattr(result, 'stdout') else ''
     for line in stdout.splitlines():
         if 'Exception' in line or 'Error' in line:
-            logging.warning('[%s] pm clear 경고: %s', serial, line.strip())
-
-    # MediaStore 전체 리프레시 (pm clear 후 provider 재기동 트리거)
-    # Android 16에서 MEDIA_MOUNTED는 SecurityException 발생 → 폴백으로 MediaProvider 재시작
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'am', 'broadcast', '-a', 'android.intent.action.MEDIA_MOUNTED',
-        '-d', 'file:///sdcard'
-    ])
-    stderr = result.stderr if hasattr(result, 'stderr') else ''
-    if 'SecurityException' in stderr:
-        logging.info('[%s] MEDIA_MOUNTED 권한 거부 — MediaProvider 재시작으로 폴백', serial)
-        run_command(['adb', '-s', serial, 'shell',
-                     'am', 'force-stop', 'com.android.providers.media'])
-        run_command(['adb', '-s', serial, 'shell',
-                     'am', 'force-stop', 'com.google.android.providers.media.module'])
-    time.sleep(2)
+            log.warning('[%s] pm clear 경고: %s', serial, line.strip())
+
+    # MediaStore 리프레시 (pm clear 후 provider 재기동 트리거)
+    # API 29+는 MediaProvider의 scan_volume 호출로 바로 스캔 요청 → 실패 시 MEDIA_MOUNTED 브로드캐스트로 폴백
+    result = run_shell(serial, 'content call --uri content://media --method scan_volume --arg external_primary')
+    output = (result.stdout if hasattr(result, 'stdout') else '') + (result.stderr if hasattr(result, 'stderr') else '')
+    if result.returncode == 0 and 'Exception' not in output and 'Error' not in output:
+        log.info('[%s] MediaStore 스캔 요청 완료', serial)
+    else:
+        log.info('[%s] scan_volume 실패 — MEDIA_MOUNTED 브로드캐스트로 폴백', serial)
+        # Android 16에서 MEDIA_MOUNTED는 SecurityException 발생 → 폴백으로 MediaProvider 재시작
+        result = run_shell(serial, 'am broadcast -a android.intent.action.MEDIA_MOUNTED -d file:///sdcard')
+        stderr = result.stderr if hasattr(result, 'stderr') else ''
+        if 'SecurityException' in stderr:
+            log.info('[%s] MEDIA_MOUNTED 권한 거부 — MediaProvider 재시작으로 폴백', serial)
+            media_providers = ['com.android.providers.media', 'com.google.android.providers.media.module']
+            run_shell(serial, '; '.join(f'am force-stop {pkg}' for pkg in media_providers), capture=False)
+            wait_stopped(serial, media_providers)
 
-    logging.info('[%s] 갤러리 휴지통 완전 정리 완료', serial)
+    log.info('[%s] 갤러리 휴지통 완전 정리 완료', serial)
 
 
 # ============================================================
 # 3. 기존 기능 (V5에서 유지)
 # ============================================================
 
+# 사용자 앱 삭제 시 보존할 앱
+EXCLUDE_APPS = (
+    'com.sec.android.app.popupcalculator',
+    'com.nhn.android.nmap',
+    'com.alphainventor.filemanager',
+)
+
+
 def delete_user_installed_apps(serial):
     """제외 목록을 제외한 사용자가 설치한 앱을 삭제합니다."""
-    exclude_apps = [
-        'com.sec.android.app.popupcalculator',
-        'com.nhn.android.nmap',
-        'com.alphainventor.filemanager',
-    ]
-    output = subprocess.check_output([
-        'adb', '-s', serial, 'shell',
-        'pm', 'list', 'packages', '--user', '0', '-3'
-    ]).decode('utf-8')
-    installed_apps = [line.replace('package:', '').strip() for line in output.splitlines() if line.strip()]
-
-    for app in installed_apps:
-        if app not in exclude_apps:
-            logging.info('[%s] 앱 삭제: %s', serial, app)
-            run_command(['adb', '-s', serial, 'shell', 'pm', 'uninstall', '--user', '0', app])
-        else:
-            logging.info('[%s] 앱 보존: %s', serial, app)
+    # 목록 조회 + 필터 + 삭제를 기기에서 한 번에 실행 (앱 개수만큼의 adb 왕복 제거)
+    # pm은 `cmd package`를 감싼 셸 스크립트이므로 앱마다 sh를 띄우지 않도록 cmd를 직접 호출
+    script = (
+        'for p in $(cmd package list packages --user 0 -3); do p=${p#package:}; '
+        f'case $p in {"|".join(EXCLUDE_APPS)}) echo "KEEP:$p" ;; '
+        '*) echo "REMOVE:$p"; cmd package uninstall --user 0 $p >/dev/null ;; esac; done'
+    )
+    result = run_shell(serial, script, timeout=300)
+    stdout = result.stdout if hasattr(result, 'stdout') else ''
+
+    # 삭제된 앱은 감사 기록용으로 INFO 한 줄에 모아 남기고, 보존 앱은 DEBUG로만 출력
+    removed = []
+    for line in stdout.splitlines():
+        line = line.strip()
+        if line.startswith('REMOVE:'):
+            removed.append(line[7:])
+        elif line.startswith('KEEP:'):
+            log.debug('[%s] 앱 보존: %s', serial, line[5:])
+    log.info('[%s] 삭제된 앱 %d개: %s', serial, len(removed), ', '.join(removed) or '없음')
+
+
+# 사용 기록을 삭제할 Google/브라우저 앱 (패키지: 이름)
+GOOGLE_APPS = {
+    'com.google.android.googlequicksearchbox': 'Google 검색',
+    'com.android.chrome': 'Chrome',
+    'com.google.android.youtube': 'YouTube',
+    'com.google.android.gm': 'Gmail',
+    'com.google.android.apps.maps': 'Google 지도',
+    'com.google.android.apps.docs': 'Google 드라이브',
+    'com.google.android.calendar': 'Google 캘린더',
+    'com.google.android.apps.photos': 'Google 포토',
+    'com.sec.android.app.sbrowser': '삼성 인터넷 브라우저',
+}
 
 
 def clear_google_apps_history(serial):
     """Google 앱 사용 기록을 삭제합니다."""
-    google_apps = {
-        'com.google.android.googlequicksearchbox': 'Google 검색',
-        'com.android.chrome': 'Chrome',
-        'com.google.android.youtube': 'YouTube',
-        'com.google.android.gm': 'Gmail',
-        'com.google.android.apps.maps': 'Google 지도',
-        'com.google.android.apps.docs': 'Google 드라이브',
-        'com.google.android.calendar': 'Google 캘린더',
-        'com.google.android.apps.photos': 'Google 포토',
-        'com.sec.android.app.sbrowser': '삼성 인터넷 브라우저',
-    }
-    logging.info('[%s] Google 앱 사용 기록 삭제 시작...', serial)
-    for package, name in google_apps.items():
-        clear_app_data(serial, package, name)
-    logging.info('[%s] Google 앱 사용 기록 삭제 완료.', serial)
+    log.info('[%s] Google 앱 사용 기록 삭제 시작...', serial)
+    # 앱별 adb 왕복 대신 한 번의 shell 호출로 순차 초기화
+    run_shell(serial, '; '.join(f'pm clear {pkg}' for pkg in GOOGLE_APPS), timeout=120, capture=False)
+    log_cleared_apps(serial, GOOGLE_APPS)
+    log.info('[%s] Google 앱 사용 기록 삭제 완료.', serial)
 
 
 def clear_call_sms_contacts(serial):
     """통화기록, SMS, 주소록을 DEX(ContentCleaner)를 통해 삭제합니다."""
-    logging.info('[%s] 통화기록/SMS/주소록 DEX 삭제 시작...', serial)
+    log.info('[%s] 통화기록/SMS/주소록 DEX 삭제 시작...', serial)
 
     if not push_dex_if_needed(serial, 'content_cleaner.dex'):
-        logging.warning('[%s] content_cleaner.dex 없음 — 폴백: pm clear 사용', serial)
+        log.warning('[%s] content_cleaner.dex 없음 — 폴백: pm clear 사용', serial)
         clear_app_data(serial, 'com.android.providers.contacts', '주소록/통화기록')
         clear_app_data(serial, 'com.android.providers.telephony', 'SMS/MMS')
         return
 
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/content_cleaner.dex',
-        'app_process', '/system/bin', 'ContentCleaner'
-    ])
+    result = run_shell(serial, 'CLASSPATH=/data/local/tmp/content_cleaner.dex app_process /system/bin ContentCleaner')
 
     stdout = result.stdout if hasattr(result, 'stdout') else ''
     needs_fallback = {'CALL_LOG': False, 'SMS': False, 'CONTACTS': False}
@@ -422,17 +813,17 @@ def clear_call_sms_contacts(serial):
         if line.startswith('OK:'):
             parts = line.split(':', 3)
             if len(parts) >= 3:
-                logging.info('[%s] %s 삭제 완료: %s', serial, parts[1], parts[2])
+                log.info('[%s] %s 삭제 완료: %s', serial, parts[1], parts[2])
         elif line.startswith('PERMISSION_DENIED:') or line.startswith('FALLBACK:'):
             parts = line.split(':', 3)
             if len(parts) >= 2:
                 label = parts[1]
-                logging.warning('[%s] %s 권한 부족 — pm clear 폴백', serial, label)
+                log.warning('[%s] %s 권한 부족 — pm clear 폴백', serial, label)
                 needs_fallback[label] = True
         elif line.startswith('FAIL:'):
             parts = line.split(':', 3)
             if len(parts) >= 2:
-                logging.warning('[%s] %s 삭제 실패: %s', serial, parts[1],
+                log.warning('[%s] %s 삭제 실패: %s', serial, parts[1],
                               parts[2] if len(parts) > 2 else '')
 
     # 실패한 항목에 대해 pm clear 폴백
@@ -442,29 +833,28 @@ def clear_call_sms_contacts(serial):
         clear_app_data(serial, 'com.android.providers.telephony', 'SMS/MMS (폴백)')
 
     # 삼성 메시지 앱 데이터 초기화 (임시저장 문자 등 앱 자체 DB 삭제)
-    clear_app_data(serial, 'com.samsung.android.messaging', '삼성 메시지 (임시저장 포함)')
-    clear_app_data(serial, 'com.samsung.android.providers.contacts', '삼성 연락처 프로바이더')
-    clear_app_data(serial, 'com.samsung.android.app.contacts', '삼성 연락처 앱')
-    clear_app_data(serial, 'com.samsung.android.dsms', '삼성 DSMS')
-    clear_app_data(serial, 'com.android.mms.service', 'MMS 서비스')
+    clear_apps_data(serial, {
+        'com.samsung.android.messaging': '삼성 메시지 (임시저장 포함)',
+        'com.samsung.android.providers.contacts': '삼성 연락처 프로바이더',
+        'com.samsung.android.app.contacts': '삼성 연락처 앱',
+        'com.samsung.android.dsms': '삼성 DSMS',
+        'com.android.mms.service': 'MMS 서비스',
+    })
 
-    logging.info('[%s] 통화기록/SMS/주소록 삭제 완료', serial)
+    log.info('[%s] 통화기록/SMS/주소록 삭제 완료', serial)
 
 
 def delete_esim_profiles(serial):
     """e-SIM 프로필을 감지하고 비활성화 + 삭제합니다."""
-    logging.info('[%s] e-SIM 프로필 확인 시작...', serial)
+    log.info('[%s] e-SIM 프로필 확인 시작...', serial)
 
     if not push_dex_if_needed(serial, 'esim_manager.dex'):
-        logging.warning('[%s] esim_manager.dex 없음 — e-SIM 처리 건너뜀', serial)
+        log.warning('[%s] esim_manager.dex 없음 — e-SIM 처리 건너뜀', serial)
         return
 
     # DEX로 e-SIM 프로필 비활성화 + 삭제
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/esim_manager.dex',
-        'app_process', '/system/bin', 'EsimManager', 'delete-all'
-    ])
+    result = run_shell(serial, 'CLASSPATH=/data/local/tmp/esim_manager.dex '
+                               'app_process /system/bin EsimManager delete-all')
 
     stdout = result.stdout if hasattr(result, 'stdout') else ''
     stderr = result.stderr if hasattr(result, 'stderr') else ''
@@ -479,55 +869,52 @@ def delete_esim_profiles(serial):
             esim_found = True
             parts = line.split(':', 6)
             if len(parts) >= 4:
-                logging.info('[%s] e-SIM 발견: subId=%s iccId=%s 캐리어=%s',
+                log.info('[%s] e-SIM 발견: subId=%s iccId=%s 캐리어=%s',
                             serial, parts[1], parts[2], parts[3])
         elif line.startswith('SUCCESS:NO_ESIM'):
-            logging.info('[%s] e-SIM 프로필 없음', serial)
+            log.info('[%s] e-SIM 프로필 없음', serial)
             return
         elif line.startswith('OK:ESIM_DISABLED'):
-            logging.info('[%s] e-SIM 비활성화 완료: %s', serial, line.split(':', 2)[-1])
+            log.info('[%s] e-SIM 비활성화 완료: %s', serial, line.split(':', 2)[-1])
         elif line.startswith('SUCCESS:ALL_ESIM_DISABLED'):
             all_disabled = True
-            logging.info('[%s] 모든 e-SIM 프로필 비활성화 완료', serial)
+            log.info('[%s] 모든 e-SIM 프로필 비활성화 완료', serial)
         elif line.startswith('OK:ESIM_DELETED'):
-            logging.info('[%s] e-SIM 삭제 완료: %s', serial, line.split(':', 2)[-1])
+            log.info('[%s] e-SIM 삭제 완료: %s', serial, line.split(':', 2)[-1])
         elif line.startswith('SUCCESS:ALL_ESIM_DELETED'):
             all_deleted = True
-            logging.info('[%s] 모든 e-SIM 프로필 삭제 완료', serial)
+            log.info('[%s] 모든 e-SIM 프로필 삭제 완료', serial)
         elif line.startswith('FAIL:ESIM_DELETE'):
             delete_failed = True
-            logging.warning('[%s] e-SIM 삭제 실패: %s', serial, line.split(':', 2)[-1])
+            log.warning('[%s] e-SIM 삭제 실패: %s', serial, line.split(':', 2)[-1])
         elif line.startswith('FAIL:ESIM_DISABLE'):
-            logging.warning('[%s] e-SIM 비활성화 실패: %s', serial, line.split(':', 2)[-1])
+            log.warning('[%s] e-SIM 비활성화 실패: %s', serial, line.split(':', 2)[-1])
         elif line.startswith('FAIL:ALL_ESIM_DELETE_FAILED'):
             delete_failed = True
-            logging.warning('[%s] 모든 e-SIM 삭제 실패', serial)
+            log.warning('[%s] 모든 e-SIM 삭제 실패', serial)
         elif line.startswith('DISABLE_METHOD:') or line.startswith('DELETE_METHOD:'):
-            logging.info('[%s] %s', serial, line)
+            log.info('[%s] %s', serial, line)
 
     if stderr:
         for line in stderr.splitlines():
             line = line.strip()
             if line:
-                logging.warning('[%s] [stderr] %s', serial, line)
+                log.warning('[%s] [stderr] %s', serial, line)
 
     # 삭제 실패시에만 수동 안내
     if esim_found and delete_failed and not all_deleted:
-        run_command([
-            'adb', '-s', serial, 'shell',
-            'am', 'start', '-a', 'android.telephony.euicc.action.MANAGE_EMBEDDED_SUBSCRIPTIONS'
-        ])
-        print()
-        print('=' * 60)
-        print('  ⚠  e-SIM 프로필 자동 삭제에 실패했습니다!')
-        print('  기기 화면에서 수동으로 삭제해주세요.')
-        print()
-        print('  👉 SIM 관리자 > eSIM 선택 > 삭제')
-        print('=' * 60)
-        print()
-        logging.warning('[%s] ⚠ e-SIM 수동 삭제 필요 — SIM 관리자 화면을 열었습니다.', serial)
-
-    logging.info('[%s] e-SIM 프로필 처리 완료', serial)
+        run_shell(serial, 'am start -a android.telephony.euicc.action.MANAGE_EMBEDDED_SUBSCRIPTIONS', capture=False)
+        log.warning(
+            '[%s] ⚠ e-SIM 수동 삭제 필요 — SIM 관리자 화면을 열었습니다.\n'
+            '%s\n'
+            '  ⚠  e-SIM 프로필 자동 삭제에 실패했습니다!\n'
+            '  기기 화면에서 수동으로 삭제해주세요.\n'
+            '\n'
+            '  👉 SIM 관리자 > eSIM 선택 > 삭제\n'
+            '%s',
+            serial, '=' * 60, '=' * 60)
+
+    log.info('[%s] e-SIM 프로필 처리 완료', serial)
 
 
 def clear_logs_and_cache(serial):
@@ -535,181 +922,196 @@ def clear_logs_and_cache(serial):
     # DEX 기반 통화기록/SMS/주소록 삭제
     clear_call_sms_contacts(serial)
 
-    clear_app_data(serial, 'com.sec.android.gallery3d', '갤러리')
-    clear_app_data(serial, 'com.nhn.android.nmap', 'Nmap')
-    clear_app_data(serial, 'com.sec.android.themestore', '테마')
-    clear_app_data(serial, 'com.sec.android.app.vepreload', '삼성 스튜디오')
-
-    # 클립보드 기록 제거 (엣지 패널 + 키보드 내 클립보드)
-    clear_app_data(serial, 'com.samsung.android.app.clipboardedge', '클립보드 엣지')
-    clear_app_data(serial, 'com.samsung.android.honeyboard', '삼성 키보드 (클립보드 포함)')
+    # 갤러리(com.sec.android.gallery3d)는 이후 deep_clean_gallery_trash에서 휴지통 삭제 후 초기화
+    clear_apps_data(serial, {
+        'com.nhn.android.nmap': 'Nmap',
+        'com.sec.android.themestore': '테마',
+        'com.sec.android.app.vepreload': '삼성 스튜디오',
+        # 클립보드 기록 제거 (엣지 패널 + 키보드 내 클립보드)
+        'com.samsung.android.app.clipboardedge': '클립보드 엣지',
+        'com.samsung.android.honeyboard': '삼성 키보드 (클립보드 포함)',
+    })
 
 
 def clear_recent_tasks(serial):
     """최근 앱 목록을 제거합니다 (app_process + DEX 방식)."""
-    logging.info('[%s] 최근 앱 목록 제거 중...', serial)
+    log.info('[%s] 최근 앱 목록 제거 중...', serial)
     if not push_dex_if_needed(serial, 'recent_tasks_cleaner.dex'):
-        logging.error('[%s] recent_tasks_cleaner.dex 없음 — 최근 앱 제거 불가', serial)
+        log.error('[%s] recent_tasks_cleaner.dex 없음 — 최근 앱 제거 불가', serial)
         return
 
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/recent_tasks_cleaner.dex',
-        'app_process', '/system/bin', 'RecentTasksCleaner'
-    ])
+    result = run_shell(serial, 'CLASSPATH=/data/local/tmp/recent_tasks_cleaner.dex '
+                               'app_process /system/bin RecentTasksCleaner')
 
     stdout = result.stdout if hasattr(result, 'stdout') else ''
     if 'SUCCESS' in stdout:
-        logging.info('[%s] %s', serial, stdout.strip())
+        log.info('[%s] %s', serial, stdout.strip())
     else:
         stderr = result.stderr if hasattr(result, 'stderr') else ''
-        logging.warning('[%s] 최근 앱 제거 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
+        log.warning('[%s] 최근 앱 제거 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
 
 
 def clear_media_store(serial):
-    """MediaStore DB를 정리합니다 (이미지, 비디오, 오디오, 파일 전체)."""
-    logging.info('[%s] MediaStore DB 정리 중...', serial)
+    """MediaStore DB를 정리하고 (이미지, 비디오, 오디오, 파일 전체) 썸네일 잔여물을 제거합니다."""
+    log.info('[%s] MediaStore DB 정리 중...', serial)
     media_uris = [
         'content://media/external/images/media',
         'content://media/external/video/media',
         'content://media/external/audio/media',
         'content://media/external/file',
     ]
-    for uri in media_uris:
-        run_command([
-            'adb', '-s', serial, 'shell',
-            'content', 'delete', '--uri', uri
-        ])
-    logging.info('[%s] MediaStore DB 정리 완료', serial)
+    # 최종 썸네일 잔여물 제거 (MediaStore 리프레시 후 재생성 방지) — DB 정리 직후 같은 shell 호출에서 실행
+    thumbnail_dirs = [f'/sdcard/{d}/.thumbnails' for d in ['DCIM', 'Pictures', 'Music', 'Movies', 'Download']]
+    commands = [f'content delete --uri {uri}' for uri in media_uris]
+    commands.append('rm -rf ' + ' '.join(shlex.quote(p) for p in thumbnail_dirs))
+    run_shell(serial, '; '.join(commands), timeout=120, capture=False)
+    log.info('[%s] MediaStore DB 정리 완료', serial)
 
 
 def push_default_wallpaper(serial, wallpaper_file, series=None):
     """기본 배경화면을 기기에 푸시하고 홈/잠금화면으로 설정합니다."""
-    image_path = resource_path(wallpaper_file)
-    if not os.path.exists(image_path):
-        logging.warning('[%s] 배경화면 파일 없음: %s', serial, image_path)
+    image_path = WALLPAPER_PATHS.get(series) or resource_path(wallpaper_file)
+    if not resource_available(image_path):
+        log.warning('[%s] 배경화면 파일 없음: %s', serial, image_path)
         return
 
     remote_path = f'/sdcard/DCIM/ForHoliday/{wallpaper_file}'
-    run_command(['adb', '-s', serial, 'shell', 'mkdir', '-p', '/sdcard/DCIM/ForHoliday'])
-    run_command(['adb', '-s', serial, 'push', image_path, remote_path])
-    run_command([
-        'adb', '-s', serial, 'shell',
-        'am', 'broadcast', '-a', 'android.intent.action.MEDIA_SCANNER_SCAN_FILE',
-        '-d', f'file://{remote_path}'
-    ])
-    logging.info('[%s] 배경화면 파일 푸시 완료', serial)
+    # adb push가 상위 디렉터리를 만들어주므로 mkdir 왕복 불필요
+    run_command([ADB, '-s', serial, 'push', image_path, remote_path], capture=False)
+    log.info('[%s] 배경화면 파일 푸시 완료', serial)
 
     # 삼성 라이브 배경화면 오버레이 앱 강제 종료 + 초기화
     # (dressroom이 라이브 배경을 자동 복원하므로 force-stop → pm clear 순서 필수)
     overlay_pkgs = ['com.samsung.android.wallpaper.live',
                     'com.samsung.android.dynamiclock',
                     'com.samsung.android.app.dressroom']
-    for pkg in overlay_pkgs:
-        run_command(['adb', '-s', serial, 'shell', 'am', 'force-stop', pkg])
-    for pkg in overlay_pkgs:
-        run_command(['adb', '-s', serial, 'shell', 'pm', 'clear', pkg])
-    time.sleep(3)
+    run_shell(serial, '; '.join([f'am force-stop {pkg}' for pkg in overlay_pkgs] +
+                                [f'pm clear {pkg}' for pkg in overlay_pkgs]), capture=False)
+    wait_stopped(serial, overlay_pkgs, timeout=3)
+
+    # 미디어 스캔 요청 (출력은 WallpaperSetter 결과 파싱에 섞이지 않도록 버림)
+    scan_cmd = f'am broadcast -a android.intent.action.MEDIA_SCANNER_SCAN_FILE -d file://{remote_path} >/dev/null'
 
     # DEX로 홈화면 + 잠금화면 자동 설정
     if not push_dex_if_needed(serial, 'wallpaper_setter.dex'):
-        logging.warning('[%s] wallpaper_setter.dex 없음 — 배경화면 자동 설정 건너뜀', serial)
+        run_shell(serial, scan_cmd, capture=False)
+        log.warning('[%s] wallpaper_setter.dex 없음 — 배경화면 자동 설정 건너뜀', serial)
         return
 
-    result = run_command([
-        'adb', '-s', serial, 'shell',
-        'CLASSPATH=/data/local/tmp/wallpaper_setter.dex',
-        'app_process', '/system/bin', 'WallpaperSetter', remote_path
-    ])
+    # 미디어 스캔 + 배경 설정을 한 번의 shell 호출로 실행
+    setter_cmd = f'CLASSPATH=/data/local/tmp/wallpaper_setter.dex app_process /system/bin WallpaperSetter {remote_path}'
+    result = run_shell(serial, f'{scan_cmd}; {setter_cmd}')
 
     stdout = result.stdout if hasattr(result, 'stdout') else ''
     if 'FAIL' in stdout:
-        logging.warning('[%s] 배경화면 설정 실패 — 오버레이 재정리 후 재시도: %s', serial, stdout.strip())
-        for pkg in overlay_pkgs:
-            run_command(['adb', '-s', serial, 'shell', 'am', 'force-stop', pkg])
-            run_command(['adb', '-s', serial, 'shell', 'pm', 'clear', pkg])
-        time.sleep(3)
-        result = run_command([
-            'adb', '-s', serial, 'shell',
-            'CLASSPATH=/data/local/tmp/wallpaper_setter.dex',
-            'app_process', '/system/bin', 'WallpaperSetter', remote_path
-        ])
+        log.warning('[%s] 배경화면 설정 실패 — 오버레이 재정리 후 재시도: %s', serial, stdout.strip())
+        run_shell(serial, '; '.join(f'am force-stop {pkg}; pm clear {pkg}' for pkg in overlay_pkgs), capture=False)
+        wait_stopped(serial, overlay_pkgs, timeout=3)
+        result = run_shell(serial, setter_cmd)
         stdout = result.stdout if hasattr(result, 'stdout') else ''
 
     if 'SUCCESS' in stdout:
-        logging.info('[%s] 홈화면 + 잠금화면 배경 설정 완료', serial)
+        log.info('[%s] 홈화면 + 잠금화면 배경 설정 완료', serial)
     else:
         stderr = result.stderr if hasattr(result, 'stderr') else ''
-        logging.warning('[%s] 배경화면 설정 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
+        log.warning('[%s] 배경화면 설정 결과 불확실: %s %s', serial, stdout.strip(), stderr.strip())
 
     # 설정 후 검증: 라이브 배경이 다시 덮어씌웠는지 확인 (5초 대기 후 체크)
     time.sleep(5)
-    verify = run_command(['adb', '-s', serial, 'shell', 'dumpsys', 'wallpaper'])
+    verify = run_shell(serial, 'dumpsys wallpaper')
     verify_out = verify.stdout if hasattr(verify, 'stdout') else ''
 
     # 홈화면 또는 잠금화면에 라이브 배경 컴포넌트가 있으면 재설정
     live_override = ('InfinityWallpaper' in verify_out or 'wallpaper.live' in verify_out) \
         and 'mName=WallpaperSetter' not in verify_out
     if live_override:
-        logging.warning('[%s] 라이브 배경 오버레이 감지 — force-stop + pm clear 후 재설정', serial)
-        for pkg in overlay_pkgs:
-            run_command(['adb', '-s', serial, 'shell', 'am', 'force-stop', pkg])
-            run_command(['adb', '-s', serial, 'shell', 'pm', 'clear', pkg])
-        time.sleep(5)
-        result = run_command([
-            'adb', '-s', serial, 'shell',
-            'CLASSPATH=/data/local/tmp/wallpaper_setter.dex',
-            'app_process', '/system/bin', 'WallpaperSetter', remote_path
-        ])
+        log.warning('[%s] 라이브 배경 오버레이 감지 — force-stop + pm clear 후 재설정', serial)
+        run_shell(serial, '; '.join(f'am force-stop {pkg}; pm clear {pkg}' for pkg in overlay_pkgs), capture=False)
+        wait_stopped(serial, overlay_pkgs, timeout=5)
+        result = run_shell(serial, setter_cmd)
         stdout2 = result.stdout if hasattr(result, 'stdout') else ''
         if 'SUCCESS' in stdout2:
-            logging.info('[%s] 배경화면 재설정 성공 (오버레이 제거 후)', serial)
+            log.info('[%s] 배경화면 재설정 성공 (오버레이 제거 후)', serial)
         else:
-            logging.warning('[%s] 배경화면 재설정 실패: %s', serial, stdout2.strip())
+            log.warning('[%s] 배경화면 재설정 실패: %s', serial, stdout2.strip())
 
 
 
 def wipe_internal_storage(serial):
     """내장 메모리 전체를 삭제합니다."""
-    logging.info('[%s] 내장 메모리 전체 삭제 시작', serial)
-    run_command(['adb', '-s', serial, 'shell', 'rm', '-rf', '/storage/emulated/0/*'])
-    run_command(['adb', '-s', serial, 'shell', 'rm', '-rf', '/storage/emulated/0/.*'])
-    logging.info('[%s] 내장 메모리 전체 삭제 완료', serial)
+    log.info('[%s] 내장 메모리 전체 삭제 시작', serial)
+    # 일반 + 숨김 파일을 한 번에 삭제 (rm은 '.', '..'은 건너뜀)
+    run_shell(serial, 'rm -rf /storage/emulated/0/* /storage/emulated/0/.*', timeout=300, capture=False)
+    log.info('[%s] 내장 메모리 전체 삭제 완료', serial)
+
+
+# 초기화 후 반드시 설치되어 있어야 하는 앱
+ESSENTIAL_APPS = (
+    {'package': 'com.nhn.android.nmap', 'name': 'Nmap', 'apk_path': APK_PATHS['nmap']},
+    {'package': 'com.alphainventor.filemanager', 'name': 'File Manager', 'apk_path': APK_PATHS['filemanager']},
+)
 
 
 def ensure_essential_apps_installed(serial):
     """필수 앱이 설치되어 있는지 확인하고 없으면 설치합니다."""
-    apps = [
-        {'package': 'com.nhn.android.nmap', 'name': 'Nmap', 'apk_path': resource_path('nmap.apk')},
-        {'package': 'com.alphainventor.filemanager', 'name': 'File Manager', 'apk_path': resource_path('filemanager.apk')},
-    ]
-    output = subprocess.check_output([
-        'adb', '-s', serial, 'shell', 'pm', 'list', 'packages'
-    ]).decode('utf-8')
-
-    for app in apps:
-        if f"package:{app['package']}" in output:
-            logging.info('[%s] %s 이미 설치됨', serial, app['name'])
+    # 전체 패키지 목록 대신 필수 앱 줄만 기기에서 걸러 받음 (-x: 줄 전체 일치라 prefix 오탐 없음)
+    # 목록 조회 자체가 실패하면 종료 코드 2로 구분 (grep은 일치 없음이 1, 오류가 2)
+    # 지속 셸 세션을 끝내지 않도록 exit 대신 서브셸 (exit 2)로 종료 코드만 설정
+    patterns = ' '.join(f"-e package:{app['package']}" for app in ESSENTIAL_APPS)
+    result = run_shell(serial, f'if out=$(cmd package list packages); then echo "$out" | grep -xF {patterns}; '
+                               f'else (exit 2); fi')
+    if result.returncode not in (0, 1):
+        # 빈 출력을 '미설치'로 보고 전부 재설치하지 않도록 건너뜀
+        log.warning('[%s] 패키지 목록 조회 실패 (rc=%s) — 필수 앱 설치 확인 건너뜀', serial, result.returncode)
+        return
+    installed = {line[len('package:'):].strip() for line in result.stdout.splitlines() if line.startswith('package:')}
+
+    missing = []
+    for app in ESSENTIAL_APPS:
+        if app['package'] in installed:
+            log.info('[%s] %s 이미 설치됨', serial, app['name'])
+        elif resource_available(app['apk_path']):
+            missing.append(app)
         else:
-            apk = app['apk_path']
-            if os.path.exists(apk):
-                logging.info('[%s] %s 설치 중...', serial, app['name'])
-                run_command(['adb', '-s', serial, 'install', '-r', apk])
-                logging.info('[%s] %s 설치 완료', serial, app['name'])
-            else:
-                logging.warning('[%s] APK 파일 없음: %s', serial, apk)
+            log.warning('[%s] APK 파일 없음: %s', serial, app['apk_path'])
+
+    def install(app):
+        log.info('[%s] %s 설치 중...', serial, app['name'])
+        run_command([ADB, '-s', serial, 'install', '-r', app['apk_path']], capture=False)
+        log.info('[%s] %s 설치 완료', serial, app['name'])
+
+    # 설치는 서로 독립적이므로 동시에 진행
+    if missing:
+        with ThreadPoolExecutor(max_workers=DEVICE_WORKERS) as executor:
+            list(executor.map(install, missing))
 
 
 # ============================================================
 # 4. 메인 프로세스
 # ============================================================
 
+# 동시에 초기화할 기기 수 (adb 서버 하나에 요청이 몰리지 않도록 제한)
+MAX_DEVICE_WORKERS = 5
+
+
 def process_device(serial, locale=None):
     """단일 기기에 대한 전체 초기화 프로세스를 실행합니다."""
-    logging.info('========================================')
-    logging.info('[%s] 초기화 시작', serial)
-    logging.info('========================================')
+    log.info('========================================')
+    log.info('[%s] 초기화 시작', serial)
+    log.info('========================================')
+
+    open_shell(serial)
+    try:
+        _process_device(serial, locale)
+    finally:
+        close_shell(serial)
+
+    log.info('========================================')
+    log.info('[%s] 초기화 완료', serial)
+    log.info('========================================')
+
 
+def _process_device(serial, locale):
     series = detect_series(serial)
     wallpaper = f'{series}.png'
 
@@ -732,60 +1134,65 @@ def process_device(serial, locale=None):
 
     clear_media_store(serial)
 
-    # 최종 썸네일 잔여물 제거 (MediaStore 리프레시 후 재생성 방지)
-    for d in ['DCIM', 'Pictures', 'Music', 'Movies', 'Download']:
-        run_command(['adb', '-s', serial, 'shell', 'rm', '-rf', f'/sdcard/{d}/.thumbnails'])
-
-    push_default_wallpaper(serial, wallpaper, series)
-    ensure_essential_apps_installed(serial)
+    # 필수 앱 설치(APK 전송)는 배경화면 설정과 독립적이므로, 배경화면 검증 대기 동안 함께 진행
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        install = executor.submit(ensure_essential_apps_installed, serial)
+        push_default_wallpaper(serial, wallpaper, series)
+        install.result()
 
     # 최근 앱 목록 제거 (app_process + DEX)
     clear_recent_tasks(serial)
 
-    logging.info('========================================')
-    logging.info('[%s] 초기화 완료', serial)
-    logging.info('========================================')
 
+def reset_device(serial, locale, shutdown=False):
+    """기기 하나를 초기화하고, 요청 시 종료합니다. 예외는 기기 단위로 로깅합니다."""
+    try:
+        process_device(serial, locale)
+    except Exception as e:
+        log.error('[%s] 초기화 중 예외 발생: %s', serial, e, exc_info=True)
+        return
+    if shutdown:
+        log.info('[%s] 기기 종료 중...', serial)
+        run_command([ADB, '-s', serial, 'shell', 'reboot', '-p'], capture=False)
 
-def main():
-    while True:
-        devices = get_connected_devices()
-        if not devices:
-            logging.error('연결된 기기가 없습니다. ADB 연결을 확인해주세요.')
-        else:
-            logging.info('총 연결된 기기 수: %d', len(devices))
-            for device in devices:
-                logging.info(' - %s', device)
-
-            # [V6] 언어 선택 메뉴
-            locale = select_language()
-
-            max_workers = min(5, len(devices))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(process_device, serial, locale): serial for serial in devices}
-                for future in as_completed(futures):
-                    serial = futures[future]
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logging.error('[%s] 초기화 중 예외 발생: %s', serial, e)
-
-            logging.info('모든 기기 초기화 작업이 완료되었습니다.')
-
-            # 기기 종료 여부 확인
-            shutdown = input('기기를 종료하시겠습니까? (y/n): ').strip().lower()
-            if shutdown == 'y':
-                for serial in devices:
-                    logging.info('[%s] 기기 종료 중...', serial)
-                    run_command(['adb', '-s', serial, 'shell', 'reboot', '-p'])
-                logging.info('모든 기기 종료 명령 전송 완료')
 
+def main():
+    # 로그 출력 스레드는 main 안에서 시작/종료 (import 후 main만 호출해도 로그와 flush_logs가 동작하도록)
+    log_listener.start()
+    try:
+        _main()
+    finally:
+        log_listener.stop()
+
+
+def _main():
+    # adb 서버를 미리 한 번 띄워, 기기 스레드의 첫 adb 호출들이 서버 기동을 두고 경쟁하지 않도록 함
+    run_command([ADB, 'start-server'], capture=False)
+
+    # [V6] 언어 선택 메뉴
+    locale = select_language()
+    # 기기 종료 여부 확인 (초기화가 끝난 기기마다 적용)
+    shutdown = input('초기화가 끝난 기기를 종료하시겠습니까? (y/n): ').strip().lower() == 'y'
+
+    # 새로 연결된 기기는 엔터 입력 없이 바로 초기화 시작
+    # serial → 초기화 future. 진행 중인 기기는 잠깐 끊겼다 붙어도 중복 실행하지 않고,
+    # 작업이 끝난 기기(성공/실패 모두)는 분리된 뒤에만 목록에서 빼서 다시 연결되면 재처리
+    jobs = {}
+    log.info('기기를 연결하면 자동으로 초기화를 시작합니다. (종료하려면 Ctrl+C)')
+    with ThreadPoolExecutor(max_workers=MAX_DEVICE_WORKERS, thread_name_prefix='device') as executor:
         try:
-            logging.info('추가로 작업하실 기기를 연결 완료 후 엔터를 눌러주세요. (종료하려면 Ctrl+C)')
-            input()
+            for devices in track_devices():
+                for serial, future in list(jobs.items()):
+                    if future.done() and serial not in devices:
+                        del jobs[serial]
+                for serial in devices:
+                    if serial not in jobs:
+                        log.info('[%s] 기기 연결됨 — 초기화 시작', serial)
+                        jobs[serial] = executor.submit(reset_device, serial, locale, shutdown)
         except KeyboardInterrupt:
-            logging.info('프로그램을 종료합니다.')
-            break
+            log.info('진행 중인 기기 작업이 끝나면 프로그램을 종료합니다.')
+            executor.shutdown(cancel_futures=True)
+    log.info('프로그램을 종료합니다.')
 
 
 if __name__ == '__main__':